@@ -2,7 +2,7 @@ from fastapi import APIRouter, HTTPException, Depends, status
 from typing import List
 
 from services.content_service import ContentService
-from services.transformation_service import TransformationService
+from services.transformation_service import transformation_service
 from models.quiz import QuizCreate, QuizResponse, QuizSubmission, QuizResult
 from models.schemas import UserResponse
 from utils.dependencies import get_current_user
@@ -14,7 +14,6 @@ router = APIRouter(
 )
 
 content_service = ContentService()
-transformation_service = TransformationService()
 
 @router.post(
     "/",
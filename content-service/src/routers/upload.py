@@ -2,7 +2,7 @@ from fastapi import APIRouter, UploadFile, File, HTTPException, status
 from typing import List
 
 from services.content_service import ContentService
-from services.transformation_service import TransformationService
+from services.transformation_service import transformation_service
 from utils.file_processor import FileProcessor
 from models.lesson import LessonCreate, LessonResponse
 from models.schemas import UserResponse
@@ -15,7 +15,6 @@ router = APIRouter(
 )
 
 content_service = ContentService()
-transformation_service = TransformationService()
 
 @router.post(
     "/course",
@@ -3,24 +3,32 @@ import nltk
 from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
 from collections import Counter
+from functools import lru_cache
 from typing import List, Dict, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Expression de nettoyage compilée une seule fois
+WHITESPACE_RE = re.compile(r'\s+')
+
+@lru_cache(maxsize=None)
+def load_stopwords() -> frozenset:
+    """Vérifier/télécharger les ressources NLTK et charger les stopwords (une seule fois par processus)"""
+    try:
+        nltk.data.find('tokenizers/punkt')
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('punkt', quiet=True)
+        nltk.download('stopwords', quiet=True)
+    
+    return frozenset(stopwords.words(['english', 'french']))
+
 class TransformationService:
     """Service de transformation de contenu en micro-leçons"""
     
     def __init__(self):
-        # Télécharger les ressources NLTK
-        try:
-            nltk.data.find('tokenizers/punkt')
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('punkt')
-            nltk.download('stopwords')
-        
-        self.stopwords = set(stopwords.words(['english', 'french']))
+        self.stopwords = load_stopwords()
         self.words_per_minute = 200  # Vitesse lecture moyenne
     
     def split_into_micro_lessons(self, content: str, duration_minutes: int = 5) -> List[Dict[str, Any]]:
@@ -86,13 +94,9 @@ class TransformationService:
     
     def _clean_content(self, content: str) -> str:
         """Nettoyer et normaliser le contenu"""
-        # Supprimer les espaces multiples
-        content = re.sub(r'\s+', ' ', content)
-        
-        # Normaliser les sauts de ligne
-        content = re.sub(r'\n{3,}', '\n\n', content)
-        
-        return content.strip()
+        # Réduire tous les blancs en un espace, en une seule passe
+        # (\s couvre déjà les sauts de ligne : aucune série de \n ne subsiste)
+        return WHITESPACE_RE.sub(' ', content).strip()
     
     def _split_into_paragraphs(self, content: str) -> List[str]:
         """Diviser le contenu en paragraphes significatifs"""
@@ -1,23 +1,37 @@
-import PyPDF2
 import io
+try:
+    import fitz  # PyMuPDF : extraction native (MuPDF, en C)
+except ImportError:
+    fitz = None
+try:
+    import PyPDF2  # Repli pur Python
+except ImportError:
+    PyPDF2 = None
 from typing import Union
 from fastapi import UploadFile, HTTPException
+from fastapi.concurrency import run_in_threadpool
 import os
+import shutil
+
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # 10MB
+COPY_CHUNK_SIZE = 1024 * 1024
 
 class FileProcessor:
     @staticmethod
     async def process_upload(file: UploadFile) -> str:
         """Process uploaded file and extract text"""
-        # Check file size (max 10MB)
-        content = await file.read()
-        if len(content) > 10 * 1024 * 1024:  # 10MB
+        # Check file size (max 10MB) : lecture bornée, un fichier trop gros
+        # n'est jamais chargé entièrement en mémoire
+        content = await file.read(MAX_UPLOAD_BYTES + 1)
+        if len(content) > MAX_UPLOAD_BYTES:
             raise HTTPException(status_code=400, detail="File too large (max 10MB)")
         
         # Check file type
         filename = file.filename.lower()
         
         if filename.endswith('.pdf'):
-            return FileProcessor.extract_text_from_pdf(content)
+            # Analyse du PDF (CPU) hors de la boucle d'événements
+            return await run_in_threadpool(FileProcessor.extract_text_from_pdf, content)
         elif filename.endswith('.txt'):
             return content.decode('utf-8')
         else:
@@ -27,15 +41,24 @@ class FileProcessor:
     def extract_text_from_pdf(content: bytes) -> str:
         """Extract text from PDF bytes"""
         try:
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
-            text = ""
+            pages = []
             
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+            if fitz is not None:
+                with fitz.open(stream=content, filetype="pdf") as doc:
+                    for page in doc:
+                        page_text = page.get_text("text")
+                        if page_text:
+                            pages.append(page_text)
+            elif PyPDF2 is not None:
+                pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+                for page in pdf_reader.pages:
+                    page_text = page.extract_text()
+                    if page_text:
+                        pages.append(page_text)
+            else:
+                raise RuntimeError("PyMuPDF or PyPDF2 is required to read PDFs")
             
-            return text.strip()
+            return "\n".join(pages).strip()
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Failed to read PDF: {str(e)}")
     
@@ -46,8 +69,8 @@ class FileProcessor:
         
         file_path = os.path.join(upload_dir, file.filename)
         
+        # Copie par blocs de 1 Mo, sans charger le fichier en mémoire
         with open(file_path, "wb") as buffer:
-            content = file.file.read()
-            buffer.write(content)
+            shutil.copyfileobj(file.file, buffer, COPY_CHUNK_SIZE)
         
         return file_path
\ No newline at end of file